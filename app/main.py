@@ -1,46 +1,75 @@
 """
 公文写作API服务 - FastAPI应用主文件
 """
+import asyncio
+import hmac
 import logging
-from typing import List
-from datetime import datetime
+import platform
+import socket
+import time
+import uuid
+from io import BytesIO
+from contextlib import asynccontextmanager
+from functools import lru_cache, singledispatch
+from typing import Any, Dict, List, Optional, Tuple
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException, Depends, Security, Request, File, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 
 from app.config import settings
-from app.models.request_models import (
-    DocumentGenerateRequest, 
-    DocumentGenerateWithAttachmentsRequest,
-    DocumentGenerateWithoutAttachmentsRequest,
-    FileUploadRequest
-)
-from app.models.response_models import DocumentGenerateResponse, ErrorResponse, FileInfo
+from app.models.request_models import DocumentGenerateRequest
+from app.models.response_models import DocumentGenerateResponse, ErrorResponse
 from app.services.document_generator import document_generator
 from app.services.oss_service import oss_service
 from app.services.attachment_processor import attachment_processor
-from typing import List, Dict, Any
-import json
-import re
+from app.utils.file_utils import sanitize_filename
+from app.utils.json_utils import HAS_ORJSON, json_dumps
+from app.utils.ttl_cache import TTLCache
 
 # 配置日志
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+# 日志格式未使用线程/进程字段，关闭采集以减少每条日志的开销
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger(__name__)
 
+# 阻塞调用（文档生成、OSS上传、标题提取）所用线程池的容量
+THREADPOOL_SIZE = 100
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期：启动时调大线程池容量"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
 # 创建FastAPI应用实例
 app = FastAPI(
     title="公文写作API服务",
     description="基于GB/T9704-2012标准的党政机关公文生成服务",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    # 文档路由由下方自行注册，以便缓存序列化后的OpenAPI文档
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+    # 安装了orjson时默认使用ORJSONResponse序列化响应
+    default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse,
+    lifespan=lifespan
 )
 
+# 接口文档地址
+DOCS_URL = "/docs"
+REDOC_URL = "/redoc"
+OPENAPI_URL = "/openapi.json"
+
 # 添加CORS中间件
 app.add_middleware(
     CORSMiddleware,
@@ -50,11 +79,80 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 添加GZip压缩中间件（仅压缩超过1KB的响应）
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # HTTP Bearer认证（可选）
 security = HTTPBearer(auto_error=False)
 
-# 全局变量存储上传的附件
-uploaded_attachments = {}
+# 预先编码的API Token，避免每次认证重复读取配置和编码
+_API_TOKEN_BYTES = settings.API_TOKEN.encode('utf-8')
+
+# 上传附件会话缓存：限制条目数并设置过期时间，避免未取用的附件长期占用内存
+UPLOAD_SESSION_MAXSIZE = 1000
+UPLOAD_SESSION_TTL = 15 * 60
+uploaded_attachments = TTLCache(maxsize=UPLOAD_SESSION_MAXSIZE, ttl=UPLOAD_SESSION_TTL)
+
+# 上传文件分块读取大小
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# OSS连接检查结果缓存：健康检查探针频繁调用，短时间内复用上一次的检查结果
+OSS_HEALTH_CACHE_TTL = 10
+_oss_health_cache = TTLCache(maxsize=1, ttl=OSS_HEALTH_CACHE_TTL)
+
+# 标准附件格式的字段
+ATTACHMENT_FIELDS = ("order", "type", "name", "markdown_content")
+
+@singledispatch
+def _normalize_attachment(attachment: Any, index: int) -> Optional[Dict[str, Any]]:
+    """对象格式：直接读取属性"""
+    return {field: getattr(attachment, field) for field in ATTACHMENT_FIELDS}
+
+@_normalize_attachment.register(str)
+def _normalize_string_attachment(attachment: str, index: int) -> Optional[Dict[str, Any]]:
+    """字符串格式：智能判断附件类型并转换为标准格式，内容为空时返回None"""
+    content = attachment.strip()
+    if not content:
+        return None
+    return {
+        "order": index,
+        "type": detect_attachment_type(content),
+        "name": f"附件{index}",
+        "markdown_content": content
+    }
+
+@_normalize_attachment.register(dict)
+def _normalize_dict_attachment(attachment: dict, index: int) -> Optional[Dict[str, Any]]:
+    """字典格式：验证必需字段"""
+    for field in ATTACHMENT_FIELDS:
+        if field not in attachment:
+            raise ValueError(f"附件{index}缺少必需字段: {field}")
+    return {field: attachment[field] for field in ATTACHMENT_FIELDS}
+
+def normalize_attachments(attachments: list, skip_empty: bool = False) -> List[Dict[str, Any]]:
+    """
+    将字符串、字典、附件对象等格式的附件统一转换为标准字典格式
+    
+    Args:
+        attachments: 附件列表
+        skip_empty: 是否跳过空字符串附件（否则视为错误）
+        
+    Returns:
+        List[Dict[str, Any]]: 标准格式的附件列表
+        
+    Raises:
+        ValueError: 附件内容为空或缺少必需字段
+    """
+    result = []
+    for i, attachment in enumerate(attachments, 1):
+        normalized = _normalize_attachment(attachment, i)
+        if normalized is None:
+            if skip_empty:
+                continue
+            raise ValueError(f"附件{i}内容不能为空")
+        result.append(normalized)
+    
+    return result
 
 def parse_string_array_attachments(attachments_list: List[str]) -> list:
     """
@@ -67,24 +165,9 @@ def parse_string_array_attachments(attachments_list: List[str]) -> list:
         list: 解析后的附件列表
     """
     try:
-        result = []
-        for i, attachment_content in enumerate(attachments_list, 1):
-            if not attachment_content or not attachment_content.strip():
-                continue
-                
-            # 智能判断附件类型
-            attachment_type = detect_attachment_type(attachment_content)
-            
-            result.append({
-                "order": str(i),
-                "type": attachment_type,
-                "name": f"附件{i}",
-                "markdown_content": attachment_content.strip()
-            })
-        
-        return result
+        return normalize_attachments([content or "" for content in attachments_list], skip_empty=True)
     except Exception as e:
-        logger.error(f"解析字符串数组附件失败: {str(e)}")
+        logger.error("解析字符串数组附件失败: %s", e)
         return []
 
 def detect_attachment_type(content: str) -> str:
@@ -98,16 +181,25 @@ def detect_attachment_type(content: str) -> str:
         str: 附件类型 (table/text/mixed)
     """
     try:
-        content = content.strip()
-        
-        # 检查是否包含表格
-        has_table = "|" in content and "---" in content
-        
-        # 检查是否包含普通文本
-        lines = content.split('\n')
-        text_lines = [line for line in lines if line.strip() and not line.strip().startswith('|') and '---' not in line]
-        has_text = len(text_lines) > 0
-        
+        # 单次遍历同时检查表格标记（| 与 ---）和普通文本，三者均已确定时提前结束
+        has_pipe = False
+        has_separator = False
+        has_text = False
+        for line in content.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if '|' in line:
+                has_pipe = True
+            if '---' in line:
+                has_separator = True
+            elif not line.startswith('|'):
+                has_text = True
+            if has_pipe and has_separator and has_text:
+                break
+
+        has_table = has_pipe and has_separator
+
         if has_table and has_text:
             return "mixed"  # 表格和文本并存
         elif has_table:
@@ -116,47 +208,151 @@ def detect_attachment_type(content: str) -> str:
             return "text"   # 纯文本
             
     except Exception as e:
-        logger.error(f"检测附件类型失败: {str(e)}")
+        logger.error("检测附件类型失败: %s", e)
         return "text"  # 默认为文本类型
 
-def parse_attachments_string(attachments_str: str) -> list:
+def build_document_file_name(title: str) -> Tuple[str, str]:
     """
-    解析字符串格式的附件数据（兼容旧格式）
+    生成带时间戳的文档文件名
     
     Args:
-        attachments_str: 字符串格式的附件数据
+        title: 文档标题
         
     Returns:
-        list: 解析后的附件列表
+        Tuple[str, str]: (时间戳, 文件名)
+    """
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    return timestamp, f"{timestamp}_{sanitize_filename(title)}.docx"
+
+
+# 成功响应中除时间戳、下载链接和文件名外均为固定内容，启动时序列化为模板，
+# 动态值按出现顺序替换模板中的 %s 占位
+_DOCUMENT_RESPONSE_TEMPLATE = json_dumps({
+    "body": "文档生成成功",
+    "status_code": 200,
+    "headers": {
+        "Content-Type": "application/json",
+        "X-Generated-At": "__VALUE__",
+        "X-Service": "official-document-generator"
+    },
+    "files": [{"download_url": "__VALUE__", "file_name": "__VALUE__"}],
+    # 兼容旧格式
+    "success": True,
+    "message": "文档生成成功",
+    "download_url": "__VALUE__",
+    "file_name": "__VALUE__"
+}).replace(b'"__VALUE__"', b'%s')
+
+def build_document_response(download_url: str, file_name: str, timestamp: str) -> Response:
+    """
+    构造公文生成成功响应
+    
+    基于预序列化的模板拼接JSON字节返回，跳过FastAPI对response_model的校验和jsonable_encoder转换；
+    响应结构与DocumentGenerateResponse一致（该模型仍用于生成接口文档）。
+    
+    Args:
+        download_url: 文档下载链接
+        file_name: 文件名
+        timestamp: 生成时间戳
+        
+    Returns:
+        Response: JSON响应
+    """
+    url_json = json_dumps(download_url)
+    name_json = json_dumps(file_name)
+    content = _DOCUMENT_RESPONSE_TEMPLATE % (json_dumps(timestamp), url_json, name_json, url_json, name_json)
+    return Response(content=content, media_type="application/json")
+
+async def read_upload_file(file: UploadFile, max_size: int) -> bytes:
+    """
+    分块读取上传文件，超过大小限制时提前拒绝
+    
+    Args:
+        file: 上传的文件
+        max_size: 允许的最大字节数
+        
+    Returns:
+        bytes: 文件内容
+        
+    Raises:
+        HTTPException: 文件超过大小限制时抛出413
+    """
+    if file.size is not None and file.size > max_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"文件 {file.filename} 超过大小限制 {max_size} 字节"
+        )
+    
+    buffer = BytesIO()
+    size = 0
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"文件 {file.filename} 超过大小限制 {max_size} 字节"
+            )
+        buffer.write(chunk)
+    
+    return buffer.getvalue()
+
+async def process_upload_file(index: int, file: UploadFile) -> Dict[str, Any]:
+    """
+    读取单个上传文件并提取标题
+    
+    Args:
+        index: 文件序号（从0开始）
+        file: 上传的文件
+        
+    Returns:
+        Dict[str, Any]: 附件信息
+        
+    Raises:
+        HTTPException: 文件超限或处理失败时抛出
     """
     try:
-        # 尝试JSON解析
-        if attachments_str.startswith('[') and attachments_str.endswith(']'):
-            attachments_list = json.loads(attachments_str)
-            result = []
-            for i, att in enumerate(attachments_list, 1):
-                if isinstance(att, str):
-                    # 如果是纯字符串，创建一个默认附件
-                    result.append({
-                        "order": str(i),
-                        "type": detect_attachment_type(att),
-                        "name": f"附件{i}",
-                        "markdown_content": att
-                    })
-                elif isinstance(att, dict):
-                    result.append(att)
-            return result
+        # 读取文件内容
+        content = await read_upload_file(file, settings.MAX_FILE_SIZE)
+        
+        # 获取文件类型
+        file_type = attachment_processor._get_file_type(file.filename)
+        
+        # 提取标题
+        if file_type == 'word':
+            # 对Word文件进行标题提取
+            extracted_title = await run_in_threadpool(
+                attachment_processor._extract_title_from_word, content, file.filename
+            )
         else:
-            # 如果不是JSON格式，当作单个附件处理
-            return [{
-                "order": "1",
-                "type": detect_attachment_type(attachments_str),
-                "name": "附件1",
-                "markdown_content": attachments_str
-            }]
+            # 对非Word文件使用文件名作为标题
+            extracted_title = file.filename.rsplit('.', 1)[0] if '.' in file.filename else file.filename
+        
+        # 构造附件信息
+        attachment_info = {
+            "order": str(index + 1),
+            "name": file.filename.rsplit('.', 1)[0] if '.' in file.filename else file.filename,
+            "type": file_type,
+            "content": content,
+            "filename": file.filename,
+            "size": len(content),
+            "title": extracted_title,
+            "extracted_title": extracted_title  # 添加extracted_title字段
+        }
+        
+        logger.info("处理文件: %s, 大小: %s bytes, 提取标题: %s", file.filename, len(content), extracted_title)
+        return attachment_info
+        
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"解析附件字符串失败: {str(e)}")
-        return []
+        logger.error("处理文件 %s 时发生错误: %s", file.filename, e)
+        raise HTTPException(
+            status_code=400,
+            detail=f"处理文件 {file.filename} 时发生错误: {str(e)}"
+        )
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> bool:
     """
@@ -178,7 +374,7 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Security(security))
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    if credentials.credentials != settings.API_TOKEN:
+    if not hmac.compare_digest(credentials.credentials.encode('utf-8'), _API_TOKEN_BYTES):
         raise HTTPException(
             status_code=401,
             detail="无效的API Token",
@@ -186,38 +382,70 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Security(security))
         )
     return True
 
+# 静态响应体在启动时序列化一次，请求时直接返回
+_ROOT_RESPONSE_BODY = json_dumps({
+    "service": "公文写作API服务",
+    "version": "1.0.0",
+    "status": "running",
+    "description": "基于GB/T9704-2012标准的党政机关公文生成服务",
+    "port": settings.APP_PORT,
+    "endpoints": {
+        "generate_document": "POST /generate_document",
+        "upload_file": "POST /upload_file",
+        "generate_document_with_attachments": "POST /generate_document_with_attachments",
+        "generate_document_without_attachments": "POST /generate_document_without_attachments",
+        "health": "GET /health",
+        "docs": "GET /docs",
+        "redoc": "GET /redoc",
+        "openapi": "GET /openapi.json"
+    }
+})
+
+_API_INFO_RESPONSE_BODY = json_dumps({
+    "title": app.title,
+    "description": app.description,
+    "version": app.version,
+    "docs_url": DOCS_URL,
+    "redoc_url": REDOC_URL,
+    "openapi_url": OPENAPI_URL
+})
+
+@lru_cache(maxsize=1)
+def get_openapi_body() -> bytes:
+    """
+    生成并缓存序列化后的OpenAPI文档
+    
+    路由在启动后不再变化，首次请求时生成一次，之后直接返回缓存的字节
+    
+    Returns:
+        bytes: OpenAPI文档JSON字节
+    """
+    return json_dumps(app.openapi())
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi_json():
+    """OpenAPI文档"""
+    return Response(content=get_openapi_body(), media_type="application/json")
+
+@app.get(DOCS_URL, include_in_schema=False)
+async def swagger_ui_html():
+    """Swagger UI接口文档"""
+    return get_swagger_ui_html(openapi_url=OPENAPI_URL, title=f"{app.title} - Swagger UI")
+
+@app.get(REDOC_URL, include_in_schema=False)
+async def redoc_html():
+    """ReDoc接口文档"""
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
+
 @app.get("/")
 async def root():
     """根路径 - 服务状态检查"""
-    return {
-        "service": "公文写作API服务",
-        "version": "1.0.0",
-        "status": "running",
-        "description": "基于GB/T9704-2012标准的党政机关公文生成服务",
-        "port": settings.APP_PORT,
-        "endpoints": {
-            "generate_document": "POST /generate_document",
-            "upload_file": "POST /upload_file",
-            "generate_document_with_attachments": "POST /generate_document_with_attachments",
-            "generate_document_without_attachments": "POST /generate_document_without_attachments",
-            "health": "GET /health",
-            "docs": "GET /docs",
-            "redoc": "GET /redoc",
-            "openapi": "GET /openapi.json"
-        }
-    }
+    return Response(content=_ROOT_RESPONSE_BODY, media_type="application/json")
 
 @app.get("/api-info")
 async def api_info():
     """API信息"""
-    return {
-        "title": app.title,
-        "description": app.description,
-        "version": app.version,
-        "docs_url": app.docs_url,
-        "redoc_url": app.redoc_url,
-        "openapi_url": app.openapi_url
-    }
+    return Response(content=_API_INFO_RESPONSE_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check(request: Request):
@@ -228,11 +456,18 @@ async def health_check(request: Request):
             oss_status = False
             oss_error = "OSS服务未初始化"
         else:
-            oss_status = oss_service.check_bucket_exists()
+            oss_status = _oss_health_cache.get("bucket")
+            if oss_status is None:
+                oss_status = await run_in_threadpool(oss_service.check_bucket_exists)
+                _oss_health_cache.set("bucket", oss_status)
             oss_error = None
         
-        # 获取客户端信息
-        client_host = request.client.host if request.client else "unknown"
+        # 获取客户端信息（请求头仅在 ?verbose=1 时返回）
+        client_info = {
+            "ip": request.client.host if request.client else "unknown"
+        }
+        if request.query_params.get("verbose"):
+            client_info["headers"] = dict(request.headers)
         
         return {
             "status": "healthy",
@@ -247,14 +482,11 @@ async def health_check(request: Request):
                 "port": settings.APP_PORT,
                 "debug": settings.DEBUG
             },
-            "client_info": {
-                "ip": client_host,
-                "headers": dict(request.headers)
-            },
+            "client_info": client_info,
             "timestamp": "2024-01-15T10:00:00Z"
         }
     except Exception as e:
-        logger.error(f"健康检查失败: {str(e)}")
+        logger.error("健康检查失败: %s", e)
         return JSONResponse(
             status_code=503,
             content={
@@ -265,37 +497,50 @@ async def health_check(request: Request):
             }
         )
 
+def _build_server_info() -> Dict[str, Any]:
+    """
+    收集服务器信息（启动时执行一次）
+    
+    Returns:
+        Dict[str, Any]: 服务器信息
+    """
+    hostname = socket.gethostname()
+    try:
+        local_ip = socket.gethostbyname(hostname)
+    except OSError as e:
+        logger.warning("解析本机IP失败: %s", e)
+        local_ip = "unknown"
+    
+    return {
+        "hostname": hostname,
+        "local_ip": local_ip,
+        "platform": platform.platform(),
+        "python_version": platform.python_version(),
+        "listening_on": f"{settings.APP_HOST}:{settings.APP_PORT}"
+    }
+
+# 服务器信息和网络配置不随请求变化，启动时计算一次
+_SERVER_INFO = _build_server_info()
+_NETWORK_CONFIG = {
+    "app_host": settings.APP_HOST,
+    "app_port": settings.APP_PORT,
+    "cors_enabled": True,
+    "allowed_origins": "*"
+}
+
 @app.get("/network-check")
 async def network_check(request: Request):
     """网络诊断端点"""
-    import socket
-    import platform
-    
     try:
-        # 获取服务器信息
-        hostname = socket.gethostname()
-        local_ip = socket.gethostbyname(hostname)
-        
         return {
-            "server_info": {
-                "hostname": hostname,
-                "local_ip": local_ip,
-                "platform": platform.platform(),
-                "python_version": platform.python_version(),
-                "listening_on": f"{settings.APP_HOST}:{settings.APP_PORT}"
-            },
+            "server_info": _SERVER_INFO,
             "client_info": {
                 "remote_addr": request.client.host if request.client else "unknown",
                 "user_agent": request.headers.get("user-agent", "unknown"),
                 "forwarded_for": request.headers.get("x-forwarded-for", "none"),
                 "real_ip": request.headers.get("x-real-ip", "none")
             },
-            "network_config": {
-                "app_host": settings.APP_HOST,
-                "app_port": settings.APP_PORT,
-                "cors_enabled": True,
-                "allowed_origins": "*"
-            }
+            "network_config": _NETWORK_CONFIG
         }
     except Exception as e:
         return JSONResponse(
@@ -305,8 +550,9 @@ async def network_check(request: Request):
 
 @app.post(
     "/generate_document",
-    response_model=DocumentGenerateResponse,
+    response_model=None,
     responses={
+        200: {"model": DocumentGenerateResponse},
         400: {"model": ErrorResponse},
         401: {"model": ErrorResponse},
         500: {"model": ErrorResponse}
@@ -315,7 +561,7 @@ async def network_check(request: Request):
 async def generate_official_document(
     request: DocumentGenerateRequest,
     token_valid: bool = Depends(verify_token)
-) -> DocumentGenerateResponse:
+) -> Response:
     """
     生成公文Word文档
     
@@ -324,13 +570,13 @@ async def generate_official_document(
         token_valid: Token验证结果
         
     Returns:
-        DocumentGenerateResponse: 文档生成响应
+        Response: 文档生成响应，结构同DocumentGenerateResponse
         
     Raises:
         HTTPException: 各种错误情况
     """
     try:
-        logger.info(f"开始生成公文: {request.title}")
+        logger.info("开始生成公文: %s", request.title)
         
         # 验证请求参数 - 支持两种格式
         content = request.markdown_content or request.content
@@ -358,75 +604,28 @@ async def generate_official_document(
                 detail="发文日期不能为空"
             )
         
-        # 验证附件参数
+        # 验证附件参数并准备附件数据 - 支持混合格式
+        attachments_data = None
         if request.has_attachments:
-            if not request.attachments or len(request.attachments) == 0:
+            if not request.attachments:
                 raise HTTPException(
                     status_code=400,
                     detail="设置为有附件但未提供附件内容"
                 )
             
-            if len(request.attachments) > 3:
-                raise HTTPException(
-                    status_code=400,
-                    detail="附件数量不能超过3个"
-                )
-        
-        # 准备附件数据 - 支持混合格式
-        attachments_data = None
-        if request.has_attachments and request.attachments:
-            # 验证附件数量
-            if len(request.attachments) > 3:
+            # 附件数量上限由请求模型校验
+            try:
+                attachments_data = normalize_attachments(request.attachments)
+            except ValueError as e:
                 raise HTTPException(
                     status_code=400,
-                    detail="附件数量不能超过3个"
+                    detail=str(e)
                 )
-            
-            attachments_data = []
-            for i, attachment in enumerate(request.attachments, 1):
-                if isinstance(attachment, str):
-                    # 字符串格式：转换为标准格式
-                    if not attachment.strip():
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"附件{i}内容不能为空"
-                        )
-                    
-                    attachment_type = detect_attachment_type(attachment)
-                    attachments_data.append({
-                        "order": str(i),
-                        "type": attachment_type,
-                        "name": f"附件{i}",
-                        "markdown_content": attachment.strip()
-                    })
-                elif isinstance(attachment, dict):
-                    # 字典格式：验证必需字段
-                    required_fields = ["order", "type", "name", "markdown_content"]
-                    for field in required_fields:
-                        if field not in attachment:
-                            raise HTTPException(
-                                status_code=400,
-                                detail=f"附件{i}缺少必需字段: {field}"
-                            )
-                    
-                    attachments_data.append({
-                        "order": attachment["order"],
-                        "type": attachment["type"],
-                        "name": attachment["name"],
-                        "markdown_content": attachment["markdown_content"]
-                    })
-                else:
-                    # 对象格式：直接使用
-                    attachments_data.append({
-                        "order": attachment.order,
-                        "type": attachment.type,
-                        "name": attachment.name,
-                        "markdown_content": attachment.markdown_content
-                    })
         
         # 生成Word文档
         logger.info("开始生成Word文档")
-        document_bytes = document_generator.generate_document(
+        document_bytes = await run_in_threadpool(
+            document_generator.generate_document,
             title=request.title,
             issuing_department=request.issuing_department,
             issue_date=request.issue_date,
@@ -446,52 +645,33 @@ async def generate_official_document(
                 detail="OSS服务未初始化，无法上传文档"
             )
         
-        success, message, download_url = oss_service.upload_document(
+        success, message, download_url = await run_in_threadpool(
+            oss_service.upload_document,
             file_content=document_bytes,
             title=request.title,
             issue_date=request.issue_date
         )
         
         if not success:
-            logger.error(f"上传文档失败: {message}")
+            logger.error("上传文档失败: %s", message)
             raise HTTPException(
                 status_code=500,
                 detail=f"上传文档失败: {message}"
             )
         
         # 生成文件名
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_title = request.title.replace('/', '_').replace('\\', '_')
-        file_name = f"{timestamp}_{safe_title}.docx"
+        timestamp, file_name = build_document_file_name(request.title)
         
-        logger.info(f"文档生成成功: {file_name}")
+        logger.info("文档生成成功: %s", file_name)
         
         # 返回新格式响应
-        return DocumentGenerateResponse(
-            body="文档生成成功",
-            status_code=200,
-            headers={
-                "Content-Type": "application/json",
-                "X-Generated-At": timestamp,
-                "X-Service": "official-document-generator"
-            },
-            files=[{
-                "download_url": download_url,
-                "file_name": file_name
-            }],
-            # 兼容旧格式
-            success=True,
-            message="文档生成成功",
-            download_url=download_url,
-            file_name=file_name
-        )
+        return build_document_response(download_url, file_name, timestamp)
         
     except HTTPException:
         # 重新抛出HTTP异常
         raise
     except Exception as e:
-        logger.error(f"生成文档时发生未知错误: {str(e)}")
+        logger.error("生成文档时发生未知错误: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"生成文档时发生错误: {str(e)}"
@@ -503,6 +683,7 @@ async def generate_official_document(
         200: {"description": "文件上传成功"},
         400: {"model": ErrorResponse},
         401: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
         500: {"model": ErrorResponse}
     }
 )
@@ -532,7 +713,7 @@ async def upload_file(
                 detail="没有上传任何文件"
             )
         
-        logger.info(f"开始处理文件上传，文件数量: {len(upload_files)}")
+        logger.info("开始处理文件上传，文件数量: %s", len(upload_files))
         
         # 验证附件数量
         if len(upload_files) > 3:
@@ -541,45 +722,10 @@ async def upload_file(
                 detail="附件数量不能超过3个"
             )
         
-        # 处理上传的文件
-        processed_attachments = []
-        for i, file in enumerate(upload_files):
-            try:
-                # 读取文件内容
-                content = await file.read()
-                
-                # 获取文件类型
-                file_type = attachment_processor._get_file_type(file.filename)
-                
-                # 提取标题
-                if file_type == 'word':
-                    # 对Word文件进行标题提取
-                    extracted_title = attachment_processor._extract_title_from_word(content, file.filename)
-                else:
-                    # 对非Word文件使用文件名作为标题
-                    extracted_title = file.filename.rsplit('.', 1)[0] if '.' in file.filename else file.filename
-                
-                # 构造附件信息
-                attachment_info = {
-                    "order": str(i + 1),
-                    "name": file.filename.rsplit('.', 1)[0] if '.' in file.filename else file.filename,
-                    "type": file_type,
-                    "content": content,
-                    "filename": file.filename,
-                    "size": len(content),
-                    "title": extracted_title,
-                    "extracted_title": extracted_title  # 添加extracted_title字段
-                }
-                
-                processed_attachments.append(attachment_info)
-                logger.info(f"处理文件: {file.filename}, 大小: {len(content)} bytes, 提取标题: {extracted_title}")
-                
-            except Exception as e:
-                logger.error(f"处理文件 {file.filename} 时发生错误: {str(e)}")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"处理文件 {file.filename} 时发生错误: {str(e)}"
-                )
+        # 处理上传的文件：各文件的读取和标题提取并发进行
+        processed_attachments = list(await asyncio.gather(
+            *(process_upload_file(i, file) for i, file in enumerate(upload_files))
+        ))
         
         if not processed_attachments:
             raise HTTPException(
@@ -588,13 +734,12 @@ async def upload_file(
             )
         
         # 生成会话ID用于关联附件
-        import uuid
         session_id = str(uuid.uuid4())
         
         # 存储处理后的附件
-        uploaded_attachments[session_id] = processed_attachments
+        uploaded_attachments.set(session_id, processed_attachments)
         
-        logger.info(f"文件上传处理完成，会话ID: {session_id}")
+        logger.info("文件上传处理完成，会话ID: %s", session_id)
         
         return {
             "success": True,
@@ -617,7 +762,7 @@ async def upload_file(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"文件上传处理时发生错误: {str(e)}")
+        logger.error("文件上传处理时发生错误: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"文件上传处理失败: {str(e)}"
@@ -625,18 +770,19 @@ async def upload_file(
 
 @app.post(
     "/generate_document_with_attachments",
-    response_model=DocumentGenerateResponse,
+    response_model=None,
     responses={
+        200: {"model": DocumentGenerateResponse},
         400: {"model": ErrorResponse},
         401: {"model": ErrorResponse},
         500: {"model": ErrorResponse}
     }
 )
 async def generate_document_with_attachments(
-    request: DocumentGenerateWithAttachmentsRequest,
+    request: DocumentGenerateRequest,
     session_id: str,
     token_valid: bool = Depends(verify_token)
-) -> DocumentGenerateResponse:
+) -> Response:
     """
     生成带附件的公文文档
     
@@ -646,13 +792,14 @@ async def generate_document_with_attachments(
         token_valid: Token验证结果
         
     Returns:
-        DocumentGenerateResponse: 文档生成响应
+        Response: 文档生成响应，结构同DocumentGenerateResponse
     """
     try:
-        logger.info(f"开始生成带附件的公文: {request.title}")
+        logger.info("开始生成带附件的公文: %s", request.title)
         
-        # 验证请求参数
-        if not request.content or not request.content.strip():
+        # 验证请求参数 - 支持两种格式，附件由会话提供，忽略has_attachments/attachments字段
+        content = request.markdown_content or request.content
+        if not content or not content.strip():
             raise HTTPException(
                 status_code=400,
                 detail="正文内容不能为空"
@@ -677,21 +824,21 @@ async def generate_document_with_attachments(
             )
         
         # 获取上传的附件
-        if session_id not in uploaded_attachments:
+        attachments_data = uploaded_attachments.get(session_id)
+        if attachments_data is None:
             raise HTTPException(
                 status_code=400,
                 detail="未找到对应的附件，请先上传附件"
             )
         
-        attachments_data = uploaded_attachments[session_id]
-        
         # 生成Word文档
         logger.info("开始生成Word文档")
-        document_bytes = document_generator.generate_document(
+        document_bytes = await run_in_threadpool(
+            document_generator.generate_document,
             title=request.title,
             issuing_department=request.issuing_department,
             issue_date=request.issue_date,
-            content=request.content,
+            content=content,
             receiving_department=request.receiving_department,
             has_attachments=True,
             attachments=attachments_data
@@ -707,55 +854,35 @@ async def generate_document_with_attachments(
                 detail="OSS服务未初始化，无法上传文档"
             )
         
-        success, message, download_url = oss_service.upload_document(
+        success, message, download_url = await run_in_threadpool(
+            oss_service.upload_document,
             file_content=document_bytes,
             title=request.title,
             issue_date=request.issue_date
         )
         
         if not success:
-            logger.error(f"上传文档失败: {message}")
+            logger.error("上传文档失败: %s", message)
             raise HTTPException(
                 status_code=500,
                 detail=f"上传文档失败: {message}"
             )
         
         # 生成文件名
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_title = request.title.replace('/', '_').replace('\\', '_')
-        file_name = f"{timestamp}_{safe_title}.docx"
+        timestamp, file_name = build_document_file_name(request.title)
         
-        logger.info(f"带附件文档生成成功: {file_name}")
+        logger.info("带附件文档生成成功: %s", file_name)
         
         # 清理会话数据
-        if session_id in uploaded_attachments:
-            del uploaded_attachments[session_id]
+        uploaded_attachments.pop(session_id)
         
         # 返回响应
-        return DocumentGenerateResponse(
-            body="文档生成成功",
-            status_code=200,
-            headers={
-                "Content-Type": "application/json",
-                "X-Generated-At": timestamp,
-                "X-Service": "official-document-generator"
-            },
-            files=[{
-                "download_url": download_url,
-                "file_name": file_name
-            }],
-            # 兼容旧格式
-            success=True,
-            message="文档生成成功",
-            download_url=download_url,
-            file_name=file_name
-        )
+        return build_document_response(download_url, file_name, timestamp)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"生成带附件文档时发生错误: {str(e)}")
+        logger.error("生成带附件文档时发生错误: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"生成带附件文档时发生错误: {str(e)}"
@@ -763,17 +890,18 @@ async def generate_document_with_attachments(
 
 @app.post(
     "/generate_document_without_attachments",
-    response_model=DocumentGenerateResponse,
+    response_model=None,
     responses={
+        200: {"model": DocumentGenerateResponse},
         400: {"model": ErrorResponse},
         401: {"model": ErrorResponse},
         500: {"model": ErrorResponse}
     }
 )
 async def generate_document_without_attachments(
-    request: DocumentGenerateWithoutAttachmentsRequest,
+    request: DocumentGenerateRequest,
     token_valid: bool = Depends(verify_token)
-) -> DocumentGenerateResponse:
+) -> Response:
     """
     生成无附件的公文
     
@@ -782,36 +910,36 @@ async def generate_document_without_attachments(
         token_valid: Token验证结果
         
     Returns:
-        DocumentGenerateResponse: 生成结果
+        Response: 生成结果，结构同DocumentGenerateResponse
     """
     try:
-        logger.info(f"开始生成无附件公文: {request.title}")
+        logger.info("开始生成无附件公文: %s", request.title)
         
-        # 构造请求数据
-        doc_request = DocumentGenerateRequest(
-            content=request.content,
+        # 验证请求参数 - 支持两种格式，忽略has_attachments/attachments字段
+        content = request.markdown_content or request.content
+        if not content or not content.strip():
+            raise HTTPException(
+                status_code=400,
+                detail="正文内容不能为空"
+            )
+        
+        # 生成文档
+        document_bytes = await run_in_threadpool(
+            document_generator.generate_document,
             title=request.title,
             issuing_department=request.issuing_department,
             issue_date=request.issue_date,
+            content=content,
             receiving_department=request.receiving_department,
             has_attachments=False,
-            attachments=[]
-        )
-        
-        # 生成文档
-        document_bytes = document_generator.generate_document(
-            title=doc_request.title,
-            issuing_department=doc_request.issuing_department,
-            issue_date=doc_request.issue_date,
-            content=doc_request.content,
-            receiving_department=doc_request.receiving_department,
-            has_attachments=doc_request.has_attachments,
-            attachments=doc_request.attachments
+            attachments=None
         )
         
         # 上传到OSS
         logger.info("开始上传文档到OSS")
-        success, message, download_url = oss_service.upload_document(document_bytes, doc_request.title, doc_request.issue_date)
+        success, message, download_url = await run_in_threadpool(
+            oss_service.upload_document, document_bytes, request.title, request.issue_date
+        )
         
         if not success:
             raise HTTPException(
@@ -820,67 +948,46 @@ async def generate_document_without_attachments(
             )
         
         # 构造文件信息
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_title = doc_request.title.replace("/", "_").replace("\\", "_")
-        filename = f"{timestamp}_{safe_title}.docx"
-        
-        file_info = {
-            "filename": filename,
-            "download_url": download_url,
-            "size": len(document_bytes),
-            "content_type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        }
+        timestamp, filename = build_document_file_name(request.title)
         
-        logger.info(f"无附件公文生成成功: {filename}")
+        logger.info("无附件公文生成成功: %s", filename)
         
-        return DocumentGenerateResponse(
-            body="文档生成成功",
-            status_code=200,
-            headers={
-                "Content-Type": "application/json",
-                "X-Generated-At": datetime.now().strftime("%Y%m%d_%H%M%S"),
-                "X-Service": "official-document-generator"
-            },
-            files=[
-                FileInfo(
-                    download_url=download_url,
-                    file_name=filename
-                )
-            ],
-            # 兼容字段
-            success=True,
-            message="文档生成成功",
-            download_url=download_url,
-            file_name=filename
-        )
+        return build_document_response(download_url, filename, timestamp)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"生成无附件公文时发生错误: {str(e)}")
+        logger.error("生成无附件公文时发生错误: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"生成公文失败: {str(e)}"
         )
 
+# 500响应体固定不变，启动时序列化一次
+_INTERNAL_ERROR_RESPONSE_BODY = json_dumps({
+    "success": False,
+    "message": "服务器内部错误",
+    "error_code": "INTERNAL_SERVER_ERROR"
+})
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """全局异常处理器"""
-    logger.error(f"全局异常: {str(exc)}")
-    return JSONResponse(
+    logger.error("全局异常: %s", exc)
+    return Response(
+        content=_INTERNAL_ERROR_RESPONSE_BODY,
         status_code=500,
-        content={
-            "success": False,
-            "message": "服务器内部错误",
-            "error_code": "INTERNAL_SERVER_ERROR"
-        }
+        media_type="application/json"
     )
 
 if __name__ == "__main__":
     import uvicorn
+    # 与 run.py 保持一致：已安装uvloop、httptools时由uvicorn自动使用
     uvicorn.run(
         "app.main:app",
         host=settings.APP_HOST,
         port=settings.APP_PORT,
-        reload=settings.DEBUG
-    ) 
\ No newline at end of file
+        reload=settings.DEBUG,
+        loop="auto",
+        http="auto"
+    )
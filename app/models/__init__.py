@@ -1 +1,19 @@
-# Models package 
\ No newline at end of file
+# Models package
+
+
+def schema_example(name: str):
+    """
+    构造按需加载示例数据的json_schema_extra回调
+    
+    示例数据仅在生成OpenAPI文档时从app.models.examples导入
+    
+    Args:
+        name: examples模块中的示例变量名
+        
+    Returns:
+        Callable[[dict], None]: pydantic的json_schema_extra回调
+    """
+    def add_example(schema: dict) -> None:
+        from app.models import examples
+        schema["example"] = getattr(examples, name)
+    return add_example
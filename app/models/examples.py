@@ -0,0 +1,36 @@
+"""
+接口文档示例数据
+
+仅在生成OpenAPI文档时按需导入，不随模型定义常驻内存
+"""
+
+DOCUMENT_GENERATE_REQUEST_EXAMPLE = {
+    "content": "这是一个示例公文内容...",
+    "title": "关于XX工作的通知",
+    "issuing_department": "XX部门",
+    "issue_date": "2024年1月1日",
+    "receiving_department": "XX单位",
+    "has_attachments": False,
+    "attachments": []
+}
+
+DOCUMENT_GENERATE_RESPONSE_EXAMPLE = {
+    "body": "文档生成成功",
+    "status_code": 200,
+    "headers": {
+        "Content-Type": "application/json",
+        "X-Generated-At": "2024-01-15T10:00:00Z"
+    },
+    "files": [
+        {
+            "download_url": "https://official_document.oss-cn-shanghai.aliyuncs.com/official_documents/20240115_关于加强公文写作规范的通知.docx",
+            "file_name": "20240115_关于加强公文写作规范的通知.docx"
+        }
+    ]
+}
+
+ERROR_RESPONSE_EXAMPLE = {
+    "success": False,
+    "message": "参数验证失败",
+    "error_code": "VALIDATION_ERROR"
+}
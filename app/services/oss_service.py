@@ -1,17 +1,23 @@
 """
 阿里云OSS服务
 """
-import os
 import oss2
 import logging
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Tuple
-from io import BytesIO
 
 from app.config import settings
+from app.utils.file_utils import sanitize_filename
 
 logger = logging.getLogger(__name__)
 
+# 分片上传配置：达到阈值的文档按分片并行上传
+MULTIPART_THRESHOLD = 1024 * 1024
+PART_SIZE = 1024 * 1024
+UPLOAD_POOL_SIZE = 4
+
 class OSSService:
     """阿里云OSS服务类"""
     
@@ -61,41 +67,34 @@ class OSSService:
         try:
             # 生成文件名
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_title = self._sanitize_filename(title)
+            safe_title = sanitize_filename(title)
             filename = f"{timestamp}_{safe_title}.docx"
             
             # OSS对象键（完整路径）
             object_key = f"{settings.OSS_DOCUMENT_PREFIX}{filename}"
             
-            logger.info(f"开始上传文档到OSS: {object_key}")
+            logger.info("开始上传文档到OSS: %s", object_key)
             
             # 设置上传参数，添加正确的Content-Type和Content-Disposition
-            # 使用RFC 5987格式支持中文文件名
-            import urllib.parse
+            # 使用RFC 5987格式支持中文文件名，文件名只编码这一次
             encoded_filename = urllib.parse.quote(filename, safe='')
             headers = {
                 'Content-Type': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
                 'Content-Disposition': f'attachment; filename*=UTF-8\'\'{encoded_filename}'
             }
             
-            # 上传文件
-            result = self.bucket.put_object(object_key, file_content, headers=headers)
+            # 上传文件，大文档使用分片上传
+            if len(file_content) >= MULTIPART_THRESHOLD:
+                result = self._multipart_upload(object_key, file_content, headers)
+            else:
+                result = self.bucket.put_object(object_key, file_content, headers=headers)
             
             if result.status == 200:
-                # 生成带签名的下载链接（有效期7天）
-                # 确保对象键没有重复编码
-                import urllib.parse
-                unquoted_key = urllib.parse.unquote(object_key)
-                download_url = self.bucket.sign_url('GET', unquoted_key, 7*24*3600)
-                
-                # 修复URL编码问题
-                if '%2F' in download_url:
-                    download_url = download_url.replace('%2F', '/')
+                # 生成带签名的下载链接（有效期7天），对象键中的'/'保持不编码
+                download_url = self.bucket.sign_url('GET', object_key, 7*24*3600, slash_safe=True)
                 
-                logger.info(f"文档上传成功: {filename}")
-                logger.info(f"对象键: {object_key}")
-                logger.info(f"解码后对象键: {unquoted_key}")
-                logger.info(f"下载链接: {download_url}")
+                logger.info("文档上传成功: %s", filename)
+                logger.debug("对象键: %s，下载链接: %s", object_key, download_url)
                 return True, "文档上传成功", download_url
             else:
                 logger.error(f"文档上传失败，状态码: {result.status}")
@@ -108,28 +107,40 @@ class OSSService:
             logger.error(f"上传文档时发生错误: {str(e)}")
             return False, f"上传文档时发生错误: {str(e)}", None
     
-    def _sanitize_filename(self, filename: str) -> str:
+    def _multipart_upload(self, object_key: str, file_content: bytes, headers: dict):
         """
-        清理文件名，移除不安全字符
+        分片并行上传文档，失败时取消本次分片上传
         
         Args:
-            filename: 原始文件名
+            object_key: OSS对象键
+            file_content: 文件内容（字节）
+            headers: 上传请求头
             
         Returns:
-            str: 清理后的文件名
+            oss2.models.PutObjectResult: 合并分片的结果
         """
-        # 移除或替换不安全字符
-        unsafe_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '\n', '\r', '\t']
-        safe_filename = filename
+        upload_id = self.bucket.init_multipart_upload(object_key, headers=headers).upload_id
         
-        for char in unsafe_chars:
-            safe_filename = safe_filename.replace(char, '_')
+        def upload_part(part_number: int) -> oss2.models.PartInfo:
+            offset = (part_number - 1) * PART_SIZE
+            result = self.bucket.upload_part(
+                object_key, upload_id, part_number, file_content[offset:offset + PART_SIZE]
+            )
+            return oss2.models.PartInfo(part_number, result.etag)
         
-        # 限制长度
-        if len(safe_filename) > 100:
-            safe_filename = safe_filename[:100]
+        part_count = (len(file_content) + PART_SIZE - 1) // PART_SIZE
+        logger.info("分片上传文档: %s，共%d个分片", object_key, part_count)
         
-        return safe_filename
+        try:
+            with ThreadPoolExecutor(max_workers=min(UPLOAD_POOL_SIZE, part_count)) as executor:
+                parts = list(executor.map(upload_part, range(1, part_count + 1)))
+            return self.bucket.complete_multipart_upload(object_key, upload_id, parts)
+        except Exception:
+            try:
+                self.bucket.abort_multipart_upload(object_key, upload_id)
+            except Exception as e:
+                logger.warning("取消分片上传失败: %s", e)
+            raise
     
     def check_bucket_exists(self) -> bool:
         """
@@ -0,0 +1,24 @@
+"""
+文件名处理工具
+"""
+import re
+
+# 文件名中的不安全字符，统一替换为下划线
+# 标题多为中文，对非ASCII字符串使用预编译字符类比 str.translate 更快
+_UNSAFE_FILENAME_RE = re.compile(r'[/\\:*?"<>|\n\r\t]')
+
+# 清理后文件名的最大长度
+MAX_FILENAME_LENGTH = 100
+
+
+def sanitize_filename(filename: str) -> str:
+    """
+    清理文件名，替换不安全字符并限制长度
+
+    Args:
+        filename: 原始文件名
+
+    Returns:
+        str: 清理后的文件名
+    """
+    return _UNSAFE_FILENAME_RE.sub('_', filename)[:MAX_FILENAME_LENGTH]
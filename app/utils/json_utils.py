@@ -0,0 +1,27 @@
+"""
+JSON编码工具 - 优先使用orjson，未安装时回退到标准库json
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson为可选依赖
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    序列化为JSON字节（UTF-8，中文不转义）
+
+    Args:
+        obj: 待序列化对象
+
+    Returns:
+        bytes: JSON字节
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
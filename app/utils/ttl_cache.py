@@ -0,0 +1,95 @@
+"""
+带过期时间的LRU缓存
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """线程安全的TTL + LRU缓存，超过容量时淘汰最久未使用的条目"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        初始化缓存
+
+        Args:
+            maxsize: 最大条目数
+            ttl: 条目有效期（秒）
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        获取未过期的缓存值
+
+        Args:
+            key: 缓存键
+            default: 不存在或已过期时的返回值
+
+        Returns:
+            Any: 缓存值
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        写入缓存值
+
+        Args:
+            key: 缓存键
+            value: 缓存值
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._data[key] = (now + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._evict(now)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        取出并删除缓存值
+
+        Args:
+            key: 缓存键
+            default: 不存在或已过期时的返回值
+
+        Returns:
+            Any: 缓存值
+        """
+        with self._lock:
+            item = self._data.pop(key, None)
+            if item is None or item[0] <= time.monotonic():
+                return default
+            return item[1]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def _evict(self, now: float) -> None:
+        """超出容量时淘汰过期条目及最久未使用条目（调用方需持有锁）"""
+        expired = [key for key, (expires_at, _) in self._data.items() if expires_at <= now]
+        for key in expired:
+            del self._data[key]
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
@@ -11,6 +11,12 @@ if __name__ == "__main__":
         host=settings.APP_HOST,
         port=settings.APP_PORT,
         reload=settings.DEBUG,
+        # 上传附件会话保存在进程内缓存中，多进程时后续请求可能落到其他进程而找不到附件，
+        # 在会话迁移到共享存储之前保持单进程
+        workers=1,
+        # 已安装uvloop、httptools时自动使用，否则回退到asyncio与h11
+        loop="auto",
+        http="auto",
         access_log=True,
         log_level="info"
-    ) 
\ No newline at end of file
+    ) 